@@ -69,6 +69,11 @@ def entry_schema_for_name(name: str):
     """
     from . import direct_entries
 
+    # Function-schema names are the common case (one per helper) and resolve
+    # with a single dict probe; only class names fall through to getattr.
+    cls = direct_entries.FUNCTION_SCHEMAS.get(name)
+    if cls is not None:
+        return cls
     cls = getattr(direct_entries, name, None)
     # Resolve concrete entry classes only — the abstract function-schema base
     # is a BaseSchema subclass but isn't a valid entry type, so exclude it.
@@ -78,7 +83,7 @@ def entry_schema_for_name(name: str):
         and cls is not direct_entries.DirectEntryFunctionSchema
     ):
         return cls
-    return direct_entries.FUNCTION_SCHEMAS.get(name)
+    return None
 
 
 def schema_class_for(element_type: str, type_name: str | None = None):
@@ -160,7 +165,8 @@ def _validate_entry(data: dict):
         if schema_cls is None:
             raise ValueError(
                 f"No entry schema for name {name!r}. Expected a class in "
-                "iws.direct_entries or a key in FUNCTION_SCHEMAS."
+                "iws.direct_entries or one of "
+                f"{sorted(direct_entries.FUNCTION_SCHEMAS)}."
             )
         if source is not None and "source" in schema_cls.model_fields:
             data["source"] = source
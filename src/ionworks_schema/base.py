@@ -1,6 +1,7 @@
 """Base classes for ionworks_schema."""
 
-from typing import Any, NoReturn
+import inspect
+from typing import Any, ClassVar, NoReturn
 
 import pybamm
 from pybamm.expression_tree.operations.serialise import Serialise
@@ -163,6 +164,37 @@ def reject_runtime_object(value: Any, field_name: str, expected: str) -> NoRetur
     )
 
 
+def _make_positional_init(owner: type) -> Any:
+    """Build an ``__init__`` for ``owner`` that accepts its ``_positional_fields``.
+
+    Positional arguments are mapped, in order, onto the class's
+    ``_positional_fields`` and merged with the keyword arguments before
+    validation. Each class gets its own function so its signature can name
+    that class's fields.
+    """
+
+    def __init__(self, /, *args: Any, **data: Any) -> None:
+        if args:
+            cls = type(self)
+            names = cls._positional_fields
+            if len(args) > len(names):
+                raise TypeError(
+                    f"{cls.__name__} takes at most {len(names)} positional "
+                    f"argument(s) but {len(args)} were given"
+                )
+            for name, keys, value in zip(names, cls._positional_keys, args):
+                if not keys.isdisjoint(data):
+                    raise TypeError(
+                        f"{cls.__name__} got multiple values for argument {name!r}"
+                    )
+                data[name] = value
+        BaseModel.__init__(self, **data)
+
+    __init__.__qualname__ = f"{owner.__qualname__}.__init__"
+    __init__._positional_init = True  # type: ignore[attr-defined]
+    return __init__
+
+
 class BaseSchema(BaseModel):
     """Shared parent of every schema class in this package.
 
@@ -188,15 +220,66 @@ class BaseSchema(BaseModel):
         populate_by_name=True,
     )
 
-    # Fields to exclude from serialization (comes from dict key in parser)
-    _exclude_fields: set = set()
+    # The serialisation flags below are ClassVars: one value per class, not
+    # private attributes pydantic would copy into every instance.
+    # Fields to exclude from serialization (comes from dict key in parser).
+    _exclude_fields: ClassVar[frozenset[str]] = frozenset()
     # When False, to_config omits the "type" discriminator. Set on subclasses
     # whose serialised output must be a plain option dict (e.g. algorithm
     # options passed to pipeline algorithm classes that reject unknown keys).
-    _emit_type: bool = True
+    _emit_type: ClassVar[bool] = True
     # When True, to_config emits only the fields the caller explicitly set, for
     # subclasses whose output is merged over a consumer's own defaults.
-    _only_set_fields: bool = False
+    _only_set_fields: ClassVar[bool] = False
+    # Field names accepted positionally, in order, by ``__init__``. Subclasses
+    # list them here instead of writing an ``__init__`` that only forwards.
+    _positional_fields: ClassVar[tuple[str, ...]] = ()
+    # For each positional field, the keyword spellings (field name and alias)
+    # that would also supply it; filled in per class from the fields.
+    _positional_keys: ClassVar[tuple[frozenset[str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Only classes that take positional fields get the positional
+        # constructor; the rest keep pydantic's own ``__init__`` (and its
+        # validation fast path), and a hand-written ``__init__`` is left alone.
+        init = cls.__init__
+        if cls._positional_fields and (
+            init is BaseModel.__init__ or getattr(init, "_positional_init", False)
+        ):
+            cls.__init__ = _make_positional_init(cls)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        init = cls.__dict__.get("__init__")
+        if not getattr(init, "_positional_init", False):
+            return
+        keys = []
+        params = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_ONLY)]
+        for name in cls._positional_fields:
+            field_name, info = next(
+                (field_name, info)
+                for field_name, info in cls.model_fields.items()
+                if name in (field_name, info.alias)
+            )
+            keys.append(frozenset((field_name, info.alias or field_name)))
+            params.append(
+                inspect.Parameter(
+                    name,
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    annotation=info.rebuild_annotation(),
+                    default=(
+                        inspect.Parameter.empty if info.is_required() else info.default
+                    ),
+                )
+            )
+        params.append(inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD))
+        cls._positional_keys = tuple(keys)
+        # Pydantic builds the class signature (also on every rebuild) from the
+        # constructor's, so naming the positional fields here shows them in
+        # ``help()``/IDE signatures in place of a generic ``*args``.
+        init.__signature__ = inspect.Signature(params)
 
     def to_config(self) -> dict:
         """Build the dict you submit through ``ionworks-api``.
@@ -228,18 +311,21 @@ class BaseSchema(BaseModel):
         just ``{"lb": 0.0, "ub": 1.0}``.
         """
         config = {}
+        cls = type(self)
+        exclude_fields = cls._exclude_fields
+        fields_set = self.model_fields_set if cls._only_set_fields else None
         # Iteration yields declared fields in declaration order, then any
         # extra="allow" keys in the order supplied, so output is stable.
         for key, value in self:
             if value is None:
                 continue
             # Skip excluded fields
-            if key in self._exclude_fields:
+            if key in exclude_fields:
                 continue
-            if self._only_set_fields and key not in self.model_fields_set:
+            if fields_set is not None and key not in fields_set:
                 continue
             # ``extra="allow"`` keys have no field, so they keep their own name.
-            field = type(self).model_fields.get(key)
+            field = cls.model_fields.get(key)
             output_key = (
                 (field.serialization_alias or field.alias or key) if field else key
             )
@@ -253,8 +339,8 @@ class BaseSchema(BaseModel):
                 serialized = {"data": serialized}
             config[output_key] = serialized
         # Add type field based on class name (except for top-level containers)
-        cls_name = self.__class__.__name__
-        if self._emit_type and cls_name not in (
+        cls_name = cls.__name__
+        if cls._emit_type and cls_name not in (
             "Pipeline",
             "DataFit",
             "ArrayDataFit",
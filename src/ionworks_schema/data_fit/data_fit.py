@@ -72,11 +72,11 @@ class DataFitOptions(BaseSchema):
     {'seed': 42, 'max_iterations': 500}
     """
 
-    _emit_type: bool = False
+    _emit_type = False
     # This bag is merged over the engine's own defaults, so emitting an unset
     # field would bake a schema default into a stored config the caller never
     # asked for, and make a later default change unobservable in that payload.
-    _only_set_fields: bool = True
+    _only_set_fields = True
 
     seed: int | None = Field(
         default=None,
@@ -247,7 +247,7 @@ class DataFit(BaseSchema):
     >>> # then submit `config` via ionworks-api
     """
 
-    _exclude_fields = {"source"}
+    _exclude_fields = frozenset({"source"})
 
     # Outer union is left-to-right: a ``{name: objective}`` mapping matches the
     # dict arm; a single bare objective falls through to ``ObjectiveUnion``
@@ -1,7 +1,8 @@
 """Schemas for direct entries."""
 
+import sys
 from collections.abc import Mapping
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field
 
@@ -92,10 +93,16 @@ class DirectEntry(BaseSchema):
         # symbol-JSON, citations dropped) regardless of the container it arrived
         # in: a plain dict and a pybamm.ParameterValues produce identical output,
         # and ``from_schema`` can rely on the values already being serialised.
+        # An empty mapping (e.g. a caller's ``{}`` or an empty
+        # ``ParameterValues``) has nothing to serialise, so skip the round
+        # trip; any other input, including an empty non-mapping, still goes
+        # through the serialiser and is rejected there if invalid.
+        if parameters is None or (isinstance(parameters, Mapping) and not parameters):
+            serialized = {}
+        else:
+            serialized = serialize_parameters(parameters)
         super().__init__(
-            parameters=(
-                serialize_parameters(parameters) if parameters is not None else {}
-            ),
+            parameters=serialized,
             source=source,
             pipeline_id=pipeline_id,
             **kwargs,
@@ -130,7 +137,39 @@ class DirectEntry(BaseSchema):
         return config
 
 
-class InitialStateOfCharge(DirectEntry):
+class _SingleValueEntry(DirectEntry):
+    """Base for entries that set one value under fixed parameter names.
+
+    Subclasses name the pybamm parameters the value is written to and
+    redeclare ``value`` with its own description; the positional constructor
+    and serialisation are shared.
+    """
+
+    _parameter_names: ClassVar[tuple[str, ...]] = ()
+
+    value: NumberLike = Field(
+        ..., description="Value written to each of the entry's parameter names"
+    )
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        # The names become keys the parser hashes and compares; interning once
+        # per class lets those lookups hit the identity fast path.
+        cls._parameter_names = tuple(map(sys.intern, cls._parameter_names))
+
+    def __init__(self, value):
+        super().__init__(value=value)
+
+    def to_config(self) -> dict:
+        """Build the dict you submit through ``ionworks-api``."""
+        return {
+            "element_type": "entry",
+            "values": dict.fromkeys(self._parameter_names, self.value),
+        }
+
+
+class InitialStateOfCharge(_SingleValueEntry):
     """
     Set the initial state of charge.
 
@@ -145,22 +184,14 @@ class InitialStateOfCharge(DirectEntry):
     >>> config = iws.Pipeline({"soc": entry}).to_config()
     """
 
+    _parameter_names: ClassVar[tuple[str, ...]] = ("Initial SOC [%]",)
+
     value: NumberLike = Field(
         ..., description="Initial state of charge as a percentage (0 to 100)"
     )
 
-    def __init__(self, value):
-        super().__init__(value=value)
 
-    def to_config(self) -> dict:
-        """Build the dict you submit through ``ionworks-api``."""
-        return {
-            "element_type": "entry",
-            "values": {"Initial SOC [%]": self.value},
-        }
-
-
-class InitialTemperature(DirectEntry):
+class InitialTemperature(_SingleValueEntry):
     """
     Set the initial and ambient temperatures.
 
@@ -175,25 +206,17 @@ class InitialTemperature(DirectEntry):
     >>> config = iws.Pipeline({"temp": entry}).to_config()
     """
 
+    _parameter_names: ClassVar[tuple[str, ...]] = (
+        "Ambient temperature [K]",
+        "Initial temperature [K]",
+    )
+
     value: NumberLike = Field(
         ..., description="Initial and ambient temperatures in Kelvin"
     )
 
-    def __init__(self, value):
-        super().__init__(value=value)
-
-    def to_config(self) -> dict:
-        """Build the dict you submit through ``ionworks-api``."""
-        return {
-            "element_type": "entry",
-            "values": {
-                "Ambient temperature [K]": self.value,
-                "Initial temperature [K]": self.value,
-            },
-        }
-
 
-class InitialVoltage(DirectEntry):
+class InitialVoltage(_SingleValueEntry):
     """
     Set the initial voltage.
 
@@ -208,17 +231,9 @@ class InitialVoltage(DirectEntry):
     >>> config = iws.Pipeline({"voltage": entry}).to_config()
     """
 
-    value: NumberLike = Field(..., description="Initial voltage in volts")
-
-    def __init__(self, value):
-        super().__init__(value=value)
+    _parameter_names: ClassVar[tuple[str, ...]] = ("Initial voltage [V]",)
 
-    def to_config(self) -> dict:
-        """Build the dict you submit through ``ionworks-api``."""
-        return {
-            "element_type": "entry",
-            "values": {"Initial voltage [V]": self.value},
-        }
+    value: NumberLike = Field(..., description="Initial voltage in volts")
 
 
 class BaseInterpolation(DirectEntry):
@@ -301,7 +316,7 @@ class PiecewiseInterpolation1D(BaseInterpolation):
         **kwargs,
     ):
         super().__init__(
-            parameters=parameters or {},
+            parameters=parameters,
             source=source,
             base_parameter_name=base_parameter_name,
             breakpoint_values=breakpoint_values,
@@ -409,7 +424,7 @@ class PiecewiseInterpolation2D(BaseInterpolation):
         **kwargs,
     ):
         super().__init__(
-            parameters=parameters or {},
+            parameters=parameters,
             source=source,
             base_parameter_name=base_parameter_name,
             breakpoint1_values=breakpoint1_values,
@@ -15,6 +15,19 @@ _HalfCellModelLike = Annotated[
 ]
 
 
+class _OptionsModel(BaseSchema):
+    """Base for model schemas configured only by options and simulation settings.
+
+    ``options`` and ``simulation_settings`` are both accepted positionally,
+    in that order.
+    """
+
+    _positional_fields = ("options", "simulation_settings")
+
+    options: dict[str, Any] | None = Field(default=None)
+    simulation_settings: SimulationSettingsLike | None = Field(default=None)
+
+
 class MSMRFullCellModel(BaseSchema):
     """Full-cell MSMR model of the open-circuit potential — pairs a negative and
     positive half-cell MSMR model into one full-cell OCV.
@@ -34,25 +47,18 @@ class MSMRFullCellModel(BaseSchema):
         Persistent simulation settings (mesh + solver) re-applied at simulation
         time. When ``None`` the model defaults are used."""
 
+    _positional_fields = (
+        "negative_electrode_model",
+        "positive_electrode_model",
+        "options",
+        "simulation_settings",
+    )
+
     negative_electrode_model: _HalfCellModelLike = Field(...)
     positive_electrode_model: _HalfCellModelLike = Field(...)
     options: dict[str, Any] | None = Field(default=None)
     simulation_settings: SimulationSettingsLike | None = Field(default=None)
 
-    def __init__(
-        self,
-        negative_electrode_model,
-        positive_electrode_model,
-        options=None,
-        simulation_settings=None,
-    ):
-        super().__init__(
-            negative_electrode_model=negative_electrode_model,
-            positive_electrode_model=positive_electrode_model,
-            options=options,
-            simulation_settings=simulation_settings,
-        )
-
 
 class MSMRHalfCellModel(BaseSchema):
     """Half-cell MSMR (Multi-Species Multi-Reaction) model for one electrode's
@@ -78,19 +84,14 @@ class MSMRHalfCellModel(BaseSchema):
         Persistent simulation settings (mesh + solver) re-applied at simulation
         time. When ``None`` the model defaults are used."""
 
+    _positional_fields = ("electrode", "options", "simulation_settings")
+
     electrode: Electrode = Field(...)
     options: dict[str, Any] | None = Field(default=None)
     simulation_settings: SimulationSettingsLike | None = Field(default=None)
 
-    def __init__(self, electrode, options=None, simulation_settings=None):
-        super().__init__(
-            electrode=electrode,
-            options=options,
-            simulation_settings=simulation_settings,
-        )
-
 
-class GITTModel(BaseSchema):
+class GITTModel(_OptionsModel):
     """Diffusion-only model for fitting solid diffusivities to GITT or pulse data.
 
     The model solves x-averaged spherical particle diffusion in each modelled
@@ -136,12 +137,6 @@ class GITTModel(BaseSchema):
         Persistent simulation settings (mesh + solver) re-applied at simulation
         time. When ``None`` the model defaults are used."""
 
-    options: dict[str, Any] | None = Field(default=None)
-    simulation_settings: SimulationSettingsLike | None = Field(default=None)
-
-    def __init__(self, options=None, simulation_settings=None):
-        super().__init__(options=options, simulation_settings=simulation_settings)
-
     @field_validator("options")
     @classmethod
     def _validate_working_electrode(cls, options):
@@ -156,37 +151,19 @@ class GITTModel(BaseSchema):
         return options
 
 
-class LumpedSPMR(BaseSchema):
+class LumpedSPMR(_OptionsModel):
     """A class for the Lumped Single Particle Model with Resistance."""
 
-    options: dict[str, Any] | None = Field(default=None)
-    simulation_settings: SimulationSettingsLike | None = Field(default=None)
-
-    def __init__(self, options=None, simulation_settings=None):
-        super().__init__(options=options, simulation_settings=simulation_settings)
-
 
-class LumpedSPMeR(BaseSchema):
+class LumpedSPMeR(_OptionsModel):
     """A class for the Lumped Single Particle Model with electrolyte and Resistance."""
 
-    options: dict[str, Any] | None = Field(default=None)
-    simulation_settings: SimulationSettingsLike | None = Field(default=None)
-
-    def __init__(self, options=None, simulation_settings=None):
-        super().__init__(options=options, simulation_settings=simulation_settings)
-
 
-class SingleElectrodeLumpedSPMR(BaseSchema):
+class SingleElectrodeLumpedSPMR(_OptionsModel):
     """A class for the single-electrode Lumped SPM with Resistance."""
 
-    options: dict[str, Any] | None = Field(default=None)
-    simulation_settings: SimulationSettingsLike | None = Field(default=None)
-
-    def __init__(self, options=None, simulation_settings=None):
-        super().__init__(options=options, simulation_settings=simulation_settings)
-
 
-class ECM(BaseSchema):
+class ECM(_OptionsModel):
     """A class for the Equivalent Circuit Model.
 
     Parameters
@@ -255,9 +232,3 @@ class ECM(BaseSchema):
         Persistent simulation settings (mesh + solver) re-applied at simulation
         time. When ``None`` the model defaults are used.
     """
-
-    options: dict[str, Any] | None = Field(default=None)
-    simulation_settings: SimulationSettingsLike | None = Field(default=None)
-
-    def __init__(self, options=None, simulation_settings=None):
-        super().__init__(options=options, simulation_settings=simulation_settings)
@@ -51,7 +51,7 @@ class SimulationSettings(BaseSchema):
     """
 
     # Persisted settings are a plain nested dict with no "type" key.
-    _emit_type: bool = False
+    _emit_type = False
 
     var_pts: dict[str, int] | None = Field(default=None)
     submesh_types: dict[str, Any] | None = Field(default=None)
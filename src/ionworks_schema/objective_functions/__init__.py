@@ -5,7 +5,6 @@ from .objective_functions import (
     MSE,
     RMSE,
     SSE,
-    Wasserstein,
     ChiSquare,
     DesignFunction,
     ErrorFunction,
@@ -13,6 +12,7 @@ from .objective_functions import (
     Max,
     MultiCost,
     ObjectiveFunction,
+    Wasserstein,
     WeightedCost,
 )
 from .regularizers import Constraint, Penalty, Prior
@@ -1,14 +1,27 @@
 """Schemas for objective_functions."""
 
-from typing import Annotated, Any, ClassVar, Literal
+from typing import Annotated, ClassVar, Literal
 
 from pydantic import Field, field_validator, model_validator
 
 from .._types import NamedFloatMap, NumberLike
 from ..base import BaseSchema
 
-# Method name (``"mean"``, ``"identity"``, ``"range"``, …) or numeric value.
-_NormalizationLike = str | NumberLike
+# Method name or numeric value. Naming the methods lets pydantic-core check
+# the string arm with its literal validator instead of accepting any string.
+_NormalizationLike = (
+    Literal[
+        "mean",
+        "identity",
+        "range",
+        "sum_squares",
+        "mean_squares",
+        "root_mean_squares",
+    ]
+    | NumberLike
+)
+# NaN replacement strategy (``"mean"`` or ``"min"``) or a fixed value.
+_NanValuesLike = Literal["mean", "min"] | NumberLike
 
 # Mapping of objective name to the variable names to compute for it, or None
 # to compute all of that objective's variables.
@@ -95,7 +108,7 @@ class ObjectiveFunction(BaseSchema):
         default=None,
         description=_VARIABLE_WEIGHTS_DESCRIPTION,
     )
-    nan_values: _NormalizationLike | None = Field(
+    nan_values: _NanValuesLike | None = Field(
         default=None,
         description=_NAN_VALUES_DESCRIPTION,
     )
@@ -613,6 +626,7 @@ class WeightedCost(BaseSchema):
     # The wire format for a component is a bare {"cost", "weight"} record, so this
     # schema must not append the "type" discriminator BaseSchema adds by default.
     _emit_type = False
+    _positional_fields = ("cost", "weight")
 
     cost: CostUnion = Field(..., description="The component cost function.")
     weight: float = Field(
@@ -623,9 +637,6 @@ class WeightedCost(BaseSchema):
         ),
     )
 
-    def __init__(self, cost=None, weight: float = 1.0, **extra: Any):
-        super().__init__(cost=cost, weight=weight, **extra)
-
 
 MultiCost.model_rebuild()
 WeightedCost.model_rebuild()
@@ -51,7 +51,8 @@ class Prior(Regularizer):
     ... )
     """
 
-    _exclude_fields = {"name"}
+    _exclude_fields = frozenset({"name"})
+    _positional_fields = ("name", "distribution", "regularizer_weight")
 
     type: Literal["Prior"] = Field(default="Prior", exclude=True)
     name: str | list[str] = Field(
@@ -71,16 +72,6 @@ class Prior(Regularizer):
         ),
     )
 
-    def __init__(self, name=None, distribution=None, regularizer_weight=None, **kwargs):
-        # Widened for dict-config validation: keep positional name/distribution,
-        # accept the ``type`` discriminator + forward via **kwargs.
-        super().__init__(
-            name=name,
-            distribution=distribution,
-            regularizer_weight=regularizer_weight,
-            **kwargs,
-        )
-
 
 class Constraint(Regularizer):
     """Equality or inequality constraint evaluated at fit time.
@@ -109,6 +100,8 @@ class Constraint(Regularizer):
     ... )
     """
 
+    _positional_fields = ("fun", "regularizer_weight", "type")
+
     type: Literal["Constraint"] = "Constraint"
     fun: _RegularizerFun = Field(
         ...,
@@ -119,12 +112,6 @@ class Constraint(Regularizer):
         ),
     )
 
-    # ``type`` is an __init__ param (shadowing the builtin is intentional and
-    # matches AskTellOptimizer/GridSearch) so a round-tripped config carrying
-    # the ``type`` discriminator validates instead of raising.
-    def __init__(self, fun, regularizer_weight=None, type="Constraint"):
-        super().__init__(fun=fun, regularizer_weight=regularizer_weight, type=type)
-
 
 class Penalty(Regularizer):
     """Soft penalty term added to the fit cost.
@@ -147,15 +134,14 @@ class Penalty(Regularizer):
     ... )
     """
 
+    _positional_fields = ("fun", "regularizer_weight", "type")
+
     type: Literal["Penalty"] = "Penalty"
     fun: _RegularizerFun = Field(
         ...,
         description=("Penalty expression as a ``pybamm.Symbol`` or a constant number."),
     )
 
-    def __init__(self, fun, regularizer_weight=None, type="Penalty"):
-        super().__init__(fun=fun, regularizer_weight=regularizer_weight, type=type)
-
 
 def resolve_prior(value, name=None):
     """Resolve one prior config to a validated ``Prior`` instance.
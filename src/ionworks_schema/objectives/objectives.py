@@ -128,27 +128,15 @@ class BaseObjective(BaseSchema):
         default=None, description=_PARAMETERS_DESCRIPTION
     )
 
-    def __init__(
-        self,
-        options=None,
-        callbacks=None,
-        custom_parameters=None,
-        cost=None,
-        constraints=None,
-        penalties=None,
-        parameters=None,
-        **kwargs,
-    ):
-        super().__init__(
-            options=options,
-            callbacks=callbacks,
-            custom_parameters=custom_parameters,
-            cost=cost,
-            constraints=constraints,
-            penalties=penalties,
-            parameters=parameters,
-            **kwargs,
-        )
+    _positional_fields = (
+        "options",
+        "callbacks",
+        "custom_parameters",
+        "cost",
+        "constraints",
+        "penalties",
+        "parameters",
+    )
 
     def to_config(self) -> dict:
         """Serialise, routing ``parameters`` through the shared serialiser.
@@ -198,51 +186,19 @@ class FittingObjective(BaseObjective):
     data_input: MeasurementInput = Field(
         ..., alias="data", description=_DATA_INPUT_DESCRIPTION
     )
-    options: dict[str, Any] | None = Field(
-        default=None,
-        description=_GENERIC_OPTIONS_DESCRIPTION,
-    )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
     cost: CostUnion | None = Field(default=None, description=_COST_DESCRIPTION)
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
-    def __init__(
-        self,
-        data_input=None,
-        options=None,
-        callbacks=None,
-        custom_parameters=None,
-        constraints=None,
-        penalties=None,
-        parameters=None,
-        **kwargs,
-    ):
-        # Keep the pre-union positional slots (data_input, options, callbacks,
-        # custom_parameters, constraints, penalties, parameters). Union
-        # validation passes the 'data' alias + config kwargs (type, cost).
-        if data_input is None:
-            data_input = kwargs.pop("data", None)
-        super().__init__(
-            data_input=data_input,
-            options=options,
-            callbacks=callbacks,
-            custom_parameters=custom_parameters,
-            constraints=constraints,
-            penalties=penalties,
-            parameters=parameters,
-            **kwargs,
-        )
+    # Keep the pre-union positional slots. ``data`` is the wire alias of
+    # ``data_input``; either name is accepted as a keyword.
+    _positional_fields = (
+        "data",
+        "options",
+        "callbacks",
+        "custom_parameters",
+        "constraints",
+        "penalties",
+        "parameters",
+    )
 
 
 class SimulationObjective(FittingObjective):
@@ -295,9 +251,6 @@ class CalendarAgeing(SimulationObjective):
     type: Literal["CalendarAgeing"] = Field(default="CalendarAgeing", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -312,19 +265,6 @@ class CalendarAgeing(SimulationObjective):
             "the solver, e.g. ``starting_solution``)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class CurrentDriven(SimulationObjective):
@@ -386,9 +326,6 @@ class CurrentDriven(SimulationObjective):
     type: Literal["CurrentDriven"] = Field(default="CurrentDriven", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -403,19 +340,6 @@ class CurrentDriven(SimulationObjective):
         ),
     )
     _validate_options = field_validator("options")(_reject_interactive_preprocessing)
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class CycleAgeing(SimulationObjective):
@@ -484,9 +408,6 @@ class CycleAgeing(SimulationObjective):
     type: Literal["CycleAgeing"] = Field(default="CycleAgeing", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -514,19 +435,6 @@ class CycleAgeing(SimulationObjective):
             "cycling) whenever an experiment is supplied, overridable here)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class DesignObjective(BaseObjective):
@@ -649,33 +557,19 @@ class DesignObjective(BaseObjective):
         ),
     )
 
-    def __init__(
-        self,
-        actions,
-        constraints=None,
-        options=None,
-        callbacks=None,
-        custom_parameters=None,
-        cost=None,
-        validate_against_experiment_steps=True,
-        output_variables_full=None,
-        save_at_cycles=None,
-        penalties=None,
-        parameters=None,
-    ):
-        super().__init__(
-            actions=actions,
-            constraints=constraints,
-            options=options,
-            callbacks=callbacks,
-            custom_parameters=custom_parameters,
-            cost=cost,
-            validate_against_experiment_steps=validate_against_experiment_steps,
-            output_variables_full=output_variables_full,
-            save_at_cycles=save_at_cycles,
-            penalties=penalties,
-            parameters=parameters,
-        )
+    _positional_fields = (
+        "actions",
+        "constraints",
+        "options",
+        "callbacks",
+        "custom_parameters",
+        "cost",
+        "validate_against_experiment_steps",
+        "output_variables_full",
+        "save_at_cycles",
+        "penalties",
+        "parameters",
+    )
 
     def to_config(self) -> dict:
         """Build the dict you submit through ``ionworks-api``.
@@ -730,9 +624,6 @@ class EIS(SimulationObjective):
     type: Literal["EIS"] = Field(default="EIS", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -744,19 +635,6 @@ class EIS(SimulationObjective):
             "``solver`` / ``output_variables`` / ``solve_kwargs`` are ignored)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class ElectrodeBalancing(FittingObjective):
@@ -814,9 +692,6 @@ class ElectrodeBalancing(FittingObjective):
     )
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -843,19 +718,6 @@ class ElectrodeBalancing(FittingObjective):
             "should consume them; default False)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class ElectrodeBalancingHalfCell(FittingObjective):
@@ -894,9 +756,6 @@ class ElectrodeBalancingHalfCell(FittingObjective):
     _emit_type = False
 
     electrode: Electrode = Field(..., description=_ELECTRODE_DESCRIPTION)
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -906,47 +765,10 @@ class ElectrodeBalancingHalfCell(FittingObjective):
             "assumed)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
-    def __init__(
-        self,
-        electrode=None,
-        data_input=None,
-        options=None,
-        callbacks=None,
-        custom_parameters=None,
-        constraints=None,
-        penalties=None,
-        parameters=None,
-        **kwargs,
-    ):
-        # Electrode-leading positional slots, then the shared ones (see
-        # FittingObjective.__init__).
-        if data_input is None:
-            data_input = kwargs.pop("data", None)
-        super().__init__(
-            electrode=electrode,
-            data_input=data_input,
-            options=options,
-            callbacks=callbacks,
-            custom_parameters=custom_parameters,
-            constraints=constraints,
-            penalties=penalties,
-            parameters=parameters,
-            **kwargs,
-        )
+    # Electrode-leading positional slots, then the shared ones (see
+    # FittingObjective).
+    _positional_fields = ("electrode", *FittingObjective._positional_fields)
 
 
 class MSMRFullCell(FittingObjective):
@@ -999,9 +821,6 @@ class MSMRFullCell(FittingObjective):
     type: Literal["MSMRFullCell"] = Field(default="MSMRFullCell", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -1014,19 +833,6 @@ class MSMRFullCell(FittingObjective):
             "and ``positive voltage limits`` (required tuple)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class MSMRHalfCell(FittingObjective):
@@ -1086,9 +892,6 @@ class MSMRHalfCell(FittingObjective):
     type: Literal["MSMRHalfCell"] = Field(default="MSMRHalfCell", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -1109,19 +912,6 @@ class MSMRHalfCell(FittingObjective):
             "descending order; default False)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class OCPHalfCell(FittingObjective):
@@ -1173,9 +963,6 @@ class OCPHalfCell(FittingObjective):
     _emit_type = False
 
     electrode: Electrode = Field(..., description=_ELECTRODE_DESCRIPTION)
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -1192,47 +979,10 @@ class OCPHalfCell(FittingObjective):
             "OCP; default None, no direction assumed)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
-    def __init__(
-        self,
-        electrode=None,
-        data_input=None,
-        options=None,
-        callbacks=None,
-        custom_parameters=None,
-        constraints=None,
-        penalties=None,
-        parameters=None,
-        **kwargs,
-    ):
-        # Electrode-leading positional slots, then the shared ones (see
-        # FittingObjective.__init__).
-        if data_input is None:
-            data_input = kwargs.pop("data", None)
-        super().__init__(
-            electrode=electrode,
-            data_input=data_input,
-            options=options,
-            callbacks=callbacks,
-            custom_parameters=custom_parameters,
-            constraints=constraints,
-            penalties=penalties,
-            parameters=parameters,
-            **kwargs,
-        )
+    # Electrode-leading positional slots, then the shared ones (see
+    # FittingObjective).
+    _positional_fields = ("electrode", *FittingObjective._positional_fields)
 
 
 class Objective(FittingObjective):
@@ -1305,9 +1055,6 @@ class Pulse(SimulationObjective):
     type: Literal["Pulse"] = Field(default="Pulse", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -1328,19 +1075,6 @@ class Pulse(SimulationObjective):
         ),
     )
     _validate_options = field_validator("options")(_reject_interactive_preprocessing)
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 class Resistance(FittingObjective):
@@ -1367,9 +1101,6 @@ class Resistance(FittingObjective):
     type: Literal["Resistance"] = Field(default="Resistance", exclude=True)
     _emit_type = False
 
-    data_input: MeasurementInput = Field(
-        ..., alias="data", description=_DATA_INPUT_DESCRIPTION
-    )
     options: dict[str, Any] | None = Field(
         default=None,
         description=(
@@ -1377,19 +1108,6 @@ class Resistance(FittingObjective):
             "(required pybamm model — no default)."
         ),
     )
-    callbacks: Any | None = Field(default=None, description=_CALLBACKS_DESCRIPTION)  # noqa: ANN401
-    custom_parameters: dict[str, Any] | None = Field(
-        default=None, description=_CUSTOM_PARAMETERS_DESCRIPTION
-    )
-    constraints: list[Constraint] | None = Field(
-        default=None, description=_CONSTRAINTS_DESCRIPTION
-    )
-    penalties: list[Penalty] | None = Field(
-        default=None, description=_PENALTIES_DESCRIPTION
-    )
-    parameters: ParameterValuesLike | None = Field(
-        default=None, description=_PARAMETERS_DESCRIPTION
-    )
 
 
 def _normalize_objective_shape(data: dict) -> dict:
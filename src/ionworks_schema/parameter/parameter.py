@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator
 
 from .._types import NumberLike
 from ..base import BaseSchema
@@ -65,7 +65,17 @@ class Parameter(BaseSchema):
     >>> fit = iws.DataFit(objectives={"gitt": obj}, parameters={raw.name: param})
     """
 
-    _exclude_fields = {"name"}
+    _exclude_fields = frozenset({"name"})
+    _positional_fields = (
+        "name",
+        "initial_value",
+        "bounds",
+        "prior",
+        "normalize",
+        "check_bounds",
+        "check_initial_value",
+        "initial_guess_distribution",
+    )
 
     name: str = Field(
         ...,
@@ -136,32 +146,12 @@ class Parameter(BaseSchema):
         ),
     )
 
-    def __init__(
-        self,
-        name,
-        initial_value=None,
-        bounds=None,
-        prior=None,
-        normalize=None,
-        check_bounds=None,
-        check_initial_value=None,
-        initial_guess_distribution=None,
-    ):
-        super().__init__(
-            name=name,
-            initial_value=initial_value,
-            bounds=bounds,
-            prior=prior,
-            normalize=normalize,
-            check_bounds=check_bounds,
-            check_initial_value=check_initial_value,
-            initial_guess_distribution=initial_guess_distribution,
-        )
-
-    @model_validator(mode="after")
-    def upper_bound_greater_than_lower(self):
+    @field_validator("bounds")
+    @classmethod
+    def upper_bound_greater_than_lower(cls, bounds):
         """Validate that upper bound is greater than lower bound."""
-        if self.bounds is not None:
-            if self.bounds[0] >= self.bounds[1]:
-                raise ValueError("Bounds must be strictly increasing")
-        return self
+        # A field (not model) validator: it only needs ``bounds``, so it runs
+        # in the field's own validator chain rather than after the whole model.
+        if bounds is not None and bounds[0] >= bounds[1]:
+            raise ValueError("Bounds must be strictly increasing")
+        return bounds
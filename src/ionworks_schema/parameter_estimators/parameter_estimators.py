@@ -15,7 +15,7 @@ class _AlgorithmOptions(BaseSchema):
     algorithm classes expect from their ``options`` kwarg.
     """
 
-    _emit_type: bool = False
+    _emit_type = False
 
 
 class _PassthroughOptimizer(BaseSchema):
@@ -779,10 +779,7 @@ class GridSearch(BaseSchema):
         ),
     )
 
-    def __init__(self, npts=10, type="GridSearch"):
-        # ``type`` is forwarded so dict-discrimination (which constructs via
-        # ``cls(**data)`` for models with a custom __init__) can pass it through.
-        super().__init__(npts=npts, type=type)
+    _positional_fields = ("npts", "type")
 
 
 class Optimizer(BaseSchema):
@@ -1021,53 +1018,27 @@ class AskTellOptimizer(_AskTellBase):
         ),
     )
 
-    def __init__(
-        self,
-        method="CMAES",
-        log_to_screen=ASK_TELL_DEFAULTS["log_to_screen"],
-        sigma0=ASK_TELL_DEFAULTS["sigma0"],
-        max_iterations=ASK_TELL_DEFAULTS["max_iterations"],
-        max_unchanged_iterations=ASK_TELL_DEFAULTS["max_unchanged_iterations"],
-        max_unchanged_iterations_threshold=ASK_TELL_DEFAULTS[
-            "max_unchanged_iterations_threshold"
-        ],
-        min_iterations=ASK_TELL_DEFAULTS["min_iterations"],
-        max_evaluations=ASK_TELL_DEFAULTS["max_evaluations"],
-        population_size=ASK_TELL_DEFAULTS["population_size"],
-        threshold=ASK_TELL_DEFAULTS["threshold"],
-        absolute_tolerance=ASK_TELL_DEFAULTS["absolute_tolerance"],
-        relative_tolerance=ASK_TELL_DEFAULTS["relative_tolerance"],
-        xtol=ASK_TELL_DEFAULTS["xtol"],
-        population_convergence_tol=ASK_TELL_DEFAULTS["population_convergence_tol"],
-        flat_fitness_tol=ASK_TELL_DEFAULTS["flat_fitness_tol"],
-        convergence_patience=ASK_TELL_DEFAULTS["convergence_patience"],
-        surrogate_convergence_tol=ASK_TELL_DEFAULTS["surrogate_convergence_tol"],
-        algorithm_options=None,
-        type="AskTellOptimizer",
-    ):
-        # ``type`` is forwarded so dict-discrimination can construct this model
-        # (which has a custom __init__) with the discriminator key present.
-        super().__init__(
-            type=type,
-            method=method,
-            log_to_screen=log_to_screen,
-            sigma0=sigma0,
-            max_iterations=max_iterations,
-            max_unchanged_iterations=max_unchanged_iterations,
-            max_unchanged_iterations_threshold=max_unchanged_iterations_threshold,
-            min_iterations=min_iterations,
-            max_evaluations=max_evaluations,
-            population_size=population_size,
-            threshold=threshold,
-            absolute_tolerance=absolute_tolerance,
-            relative_tolerance=relative_tolerance,
-            xtol=xtol,
-            population_convergence_tol=population_convergence_tol,
-            flat_fitness_tol=flat_fitness_tol,
-            convergence_patience=convergence_patience,
-            surrogate_convergence_tol=surrogate_convergence_tol,
-            algorithm_options=algorithm_options,
-        )
+    _positional_fields = (
+        "method",
+        "log_to_screen",
+        "sigma0",
+        "max_iterations",
+        "max_unchanged_iterations",
+        "max_unchanged_iterations_threshold",
+        "min_iterations",
+        "max_evaluations",
+        "population_size",
+        "threshold",
+        "absolute_tolerance",
+        "relative_tolerance",
+        "xtol",
+        "population_convergence_tol",
+        "flat_fitness_tol",
+        "convergence_patience",
+        "surrogate_convergence_tol",
+        "algorithm_options",
+        "type",
+    )
 
     @model_validator(mode="after")
     def _validate_options_for_method(self):
@@ -1189,25 +1160,14 @@ class PintsSampler(BaseSchema):
         ),
     )
 
-    def __init__(
-        self,
-        method="DramACMC",
-        log_to_screen=False,
-        max_iterations=1000,
-        burnin_iterations=None,
-        initial_phase_iterations=None,
-        type="PintsSampler",
-    ):
-        # ``type`` is forwarded so dict-discrimination can construct this model
-        # (which has a custom __init__) with the discriminator key present.
-        super().__init__(
-            type=type,
-            method=method,
-            log_to_screen=log_to_screen,
-            max_iterations=max_iterations,
-            burnin_iterations=burnin_iterations,
-            initial_phase_iterations=initial_phase_iterations,
-        )
+    _positional_fields = (
+        "method",
+        "log_to_screen",
+        "max_iterations",
+        "burnin_iterations",
+        "initial_phase_iterations",
+        "type",
+    )
 
 
 class PointEstimateOptimizer(BaseSchema):
@@ -6,6 +6,11 @@ from pydantic import Field, WrapValidator
 
 from ..base import BaseSchema, reject_runtime_object
 
+# Exact builtin scalar types emitted as-is by ``Distribution.to_config``. An
+# exact-type set, not ``isinstance``: NumPy scalars subclass ``float`` but
+# must still go through ``tolist()`` to become plain Python numbers.
+_SCALAR_TYPES = frozenset({float, int, str, bool})
+
 
 class Distribution(BaseSchema):
     """A probability distribution you can sample from.
@@ -29,10 +34,15 @@ class Distribution(BaseSchema):
         API expects a distribution payload.
         """
         config = {}
-        for key, value in self:
+        # Distributions forbid extra keys, so ``__dict__`` holds exactly the
+        # declared fields in declaration order; walk it directly rather than
+        # through ``BaseModel.__iter__``.
+        for key, value in self.__dict__.items():
             if value is None:
                 continue
-            if hasattr(value, "to_config"):
+            if type(value) in _SCALAR_TYPES:
+                config[key] = value
+            elif isinstance(value, BaseSchema):
                 config[key] = value.to_config()
             elif hasattr(value, "tolist"):
                 config[key] = value.tolist()
@@ -65,9 +75,7 @@ class Dirichlet(Distribution):
         ),
     )
 
-    def __init__(self, alpha=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(alpha=alpha, **kwargs)
+    _positional_fields = ("alpha",)
 
 
 class LogNormal(Distribution):
@@ -102,9 +110,7 @@ class LogNormal(Distribution):
         ),
     )
 
-    def __init__(self, mean=None, std=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(mean=mean, std=std, **kwargs)
+    _positional_fields = ("mean", "std")
 
 
 class MultivariateLogNormal(Distribution):
@@ -144,9 +150,7 @@ class MultivariateLogNormal(Distribution):
         ),
     )
 
-    def __init__(self, mean=None, cov=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(mean=mean, cov=cov, **kwargs)
+    _positional_fields = ("mean", "cov")
 
 
 class MultivariateNormal(Distribution):
@@ -185,9 +189,7 @@ class MultivariateNormal(Distribution):
         ),
     )
 
-    def __init__(self, mean=None, cov=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(mean=mean, cov=cov, **kwargs)
+    _positional_fields = ("mean", "cov")
 
 
 class Normal(Distribution):
@@ -217,9 +219,7 @@ class Normal(Distribution):
         ),
     )
 
-    def __init__(self, mean=None, std=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(mean=mean, std=std, **kwargs)
+    _positional_fields = ("mean", "std")
 
 
 class PointMass(Distribution):
@@ -247,9 +247,7 @@ class PointMass(Distribution):
         ),
     )
 
-    def __init__(self, value=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(value=value, **kwargs)
+    _positional_fields = ("value",)
 
 
 class Uniform(Distribution):
@@ -283,9 +281,7 @@ class Uniform(Distribution):
         ),
     )
 
-    def __init__(self, lb=None, ub=None, **kwargs):
-        # Widened for the union: accept the 'distribution' discriminator via **kwargs.
-        super().__init__(lb=lb, ub=ub, **kwargs)
+    _positional_fields = ("lb", "ub")
 
 
 def _resolve_distribution(value, handler):
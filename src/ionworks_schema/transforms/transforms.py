@@ -34,8 +34,7 @@ class Transform(BaseSchema):
 
     parameter: _TransformParameter = Field(...)
 
-    def __init__(self, parameter):
-        super().__init__(parameter=parameter)
+    _positional_fields = ("parameter",)
 
     def to_config(self) -> dict:
         """Build the dict you submit through ``ionworks-api``.
@@ -47,11 +46,17 @@ class Transform(BaseSchema):
         parameter's bounds and initial value.
         """
         param = self.parameter
-        if hasattr(param, "to_config"):
+        # A schema's to_config already returns a fresh dict, so only the other
+        # sources (a caller's dict, a runtime object's config) need copying
+        # before the keys are edited below.
+        if isinstance(param, BaseSchema):
             inner = param.to_config()
+        elif hasattr(param, "to_config"):
+            inner = dict(param.to_config())
+        elif isinstance(param, dict):
+            inner = dict(param)
         else:
-            inner = dict(param) if isinstance(param, dict) else {}
-        inner = dict(inner)
+            inner = {}
         inner.pop("type", None)
         inner.pop("parameter", None)
         inner["transform"] = self.__class__.__name__
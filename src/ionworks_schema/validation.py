@@ -71,9 +71,4 @@ class Validation(BaseSchema):
         ),
     )
 
-    def __init__(
-        self,
-        objectives: dict[str, ObjectiveUnion],
-        summary_stats: list[_SummaryStatLike] | None = None,
-    ):
-        super().__init__(objectives=objectives, summary_stats=summary_stats)
+    _positional_fields = ("objectives", "summary_stats")